@@ -9,12 +9,14 @@ License: MIT
 """
 
 import argparse
+import atexit
+import importlib.util
+import re
 import sys
 import time
 from pathlib import Path
 import threading
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 try:
@@ -23,6 +25,13 @@ except ImportError as import_error:
     print("pywhatkit is not installed. Install it with: python -m pip install pywhatkit", file=sys.stderr)
     raise
 
+# Seconds a pywhatkit tab that is kept open gets to deliver its message after
+# Enter, before the next recipient's tab takes over the WhatsApp Web session.
+# pywhatkit returns right after pressing Enter, so this is the only delivery
+# margin in keep-open mode; it matches the post-send settle time the loop used
+# before sends were confirmed (20 s total, of which ~10 s followed Enter).
+_KEEP_TAB_SEND_MARGIN_SECONDS = 10
+
 # Country code data for number normalization
 COUNTRY_CODES = {
     "Turkey": {"code": "+90", "patterns": ["90", "05", "5"], "description": "Turkish mobile numbers"},
@@ -73,23 +82,37 @@ COUNTRY_CODES = {
     "Philippines": {"code": "+63", "patterns": ["63", "09"], "description": "Filipino mobile numbers"},
 }
 
-# Optional Selenium import for single-tab mode
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    # WebDriver manager to auto-resolve ChromeDriver
-    try:
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.chrome.service import Service as ChromeService
-        WEBDRIVER_MANAGER_AVAILABLE = True
-    except Exception:
-        WEBDRIVER_MANAGER_AVAILABLE = False
-    SELENIUM_AVAILABLE = True
-except Exception:
-    SELENIUM_AVAILABLE = False
+# Static views of COUNTRY_CODES used by the GUI country selector
+_COUNTRY_NAMES_SORTED = tuple(sorted(COUNTRY_CODES.keys()))
+_COUNTRY_DESC = {name: data["description"] for name, data in COUNTRY_CODES.items()}
+
+# Phone number already in E.164 format: '+' followed by digits only
+_E164_RE = re.compile(r'^\+\d+$')
+
+# Separator characters removed from raw phone numbers before normalization
+_STRIP_TABLE = str.maketrans("", "", " \t-()")
+
+# Per-country normalization rules precomputed from COUNTRY_CODES:
+# (country code, prefix matcher). The matcher is one alternation of the
+# country's patterns, longest first, so the longest matching prefix wins.
+_COUNTRY_NORM = {
+    name: (
+        data["code"],
+        re.compile("(?:" + "|".join(map(re.escape, sorted(data["patterns"], key=len, reverse=True))) + ")"),
+    )
+    for name, data in COUNTRY_CODES.items()
+}
+
+# Optional Selenium support for single-tab mode. The packages are only looked
+# up here; they are imported inside the single-tab functions on first use.
+SELENIUM_AVAILABLE = importlib.util.find_spec("selenium") is not None
+# WebDriver manager to auto-resolve ChromeDriver
+WEBDRIVER_MANAGER_AVAILABLE = importlib.util.find_spec("webdriver_manager") is not None
+
+# Single-tab Selenium session shared across sends; created lazily by _get_driver
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+_CHROMEDRIVER_PATH: str | None = None
 
 
 def read_recipients_from_file(file_path: Path) -> list[str]:
@@ -107,21 +130,20 @@ def read_recipients_from_file(file_path: Path) -> list[str]:
     Note:
         - Ignores empty lines and lines starting with '#'
         - Trims whitespace
-        - Basic validation: must start with '+' and contain only '+' and digits
+        - Basic validation: must be '+' followed by digits only
     """
     if not file_path.exists():
         raise FileNotFoundError(f"Recipients file not found: {file_path}")
 
     recipients: list[str] = []
-    with file_path.open("r", encoding="utf-8") as file_handle:
-        for raw_line in file_handle:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if not (line.startswith("+") and line.replace("+", "").isdigit()):
-                print(f"Skipping invalid phone entry: {line}", file=sys.stderr)
-                continue
-            recipients.append(line)
+    for raw_line in file_path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if not _E164_RE.match(line):
+            print(f"Skipping invalid phone entry: {line}", file=sys.stderr)
+            continue
+        recipients.append(line)
     return recipients
 
 
@@ -165,6 +187,11 @@ def send_messages_to_recipients(
         per_send_wait_seconds: Seconds to wait for WhatsApp Web to load.
         tab_close: Whether to close the tab after sending.
         close_time_seconds: Seconds to wait before closing the tab.
+
+    Note:
+        Sends run one at a time on purpose. pywhatkit opens a new browser tab
+        and sends by simulating key presses in the focused window, so
+        concurrent sends would steal focus and deliver into each other's tabs.
     """
     if not recipients:
         print("No valid recipients found.")
@@ -181,8 +208,13 @@ def send_messages_to_recipients(
                 tab_close=tab_close,
                 close_time=close_time_seconds,
             )
-            # Allow WhatsApp Web to fully load, send, and settle before next recipient
-            time.sleep(max(20, per_send_wait_seconds + 10))
+            # pywhatkit returns right after pressing Enter, without waiting for delivery.
+            # A closed tab already waited close_time_seconds inside pywhatkit; a tab kept
+            # open needs time to send before the next tab takes over the session.
+            if tab_close:
+                time.sleep(2)
+            else:
+                time.sleep(_KEEP_TAB_SEND_MARGIN_SECONDS)
         except Exception as error:  # noqa: BLE001
             print(f"Failed to send to {phone_number}: {error}", file=sys.stderr)
             # Small delay before proceeding to next number to avoid rapid retries
@@ -190,6 +222,7 @@ def send_messages_to_recipients(
     print("Done.")
 
 
+@lru_cache(maxsize=65536)
 def normalize_number(raw_number: str, country: str = "Turkey") -> str | None:
     """Normalize phone numbers to E.164 format based on country.
 
@@ -201,44 +234,49 @@ def normalize_number(raw_number: str, country: str = "Turkey") -> str | None:
         Normalized phone number in E.164 format, or None if invalid.
 
     Note:
-        Strips spaces, dashes, parentheses.
+        Strips spaces, tabs, dashes, parentheses.
         If already starts with '+', returns the cleaned number if valid.
     """
-    if not raw_number or country not in COUNTRY_CODES:
+    if not raw_number or country not in _COUNTRY_NORM:
         return None
     
-    country_data = COUNTRY_CODES[country]
-    country_code = country_data["code"]
-    patterns = country_data["patterns"]
-    
-    cleaned = (
-        raw_number.strip()
-        .replace(" ", "")
-        .replace("-", "")
-        .replace("(", "")
-        .replace(")", "")
-    )
+    country_code, matcher = _COUNTRY_NORM[country]
+    cleaned = raw_number.translate(_STRIP_TABLE).strip()
     
     # If already in E.164 format, validate and return
     if cleaned.startswith('+'):
-        return cleaned if cleaned.replace('+', '').isdigit() else None
+        return cleaned if _E164_RE.match(cleaned) else None
     
     # If not all digits, skip
     if not cleaned.isdigit():
         return None
     
-    # Check each pattern for the country
-    for pattern in patterns:
-        if cleaned.startswith(pattern):
-            if pattern == country_code.replace('+', ''):
-                # Full country code without +
-                return "+" + cleaned
-            else:
-                # Local format - replace pattern with country code
-                remaining = cleaned[len(pattern):]
-                return country_code + remaining
-    
-    return None
+    # Match the country's patterns against the start of the number
+    match = matcher.match(cleaned)
+    if not match:
+        return None
+    if match.group() == country_code[1:]:
+        # Full country code without +
+        return "+" + cleaned
+    # Local format - replace pattern with country code
+    return country_code + cleaned[match.end():]
+
+
+def normalize_many(lines: list[str], country: str = "Turkey") -> list[str]:
+    """Normalize a batch of phone numbers to E.164 format based on country.
+
+    Args:
+        lines: Raw phone number strings, one number per entry.
+        country: Country name for normalization rules.
+
+    Returns:
+        Normalized phone numbers in input order; invalid entries are dropped.
+
+    Note:
+        Goes through normalize_number, so repeated entries are served from
+        its cache instead of being normalized again.
+    """
+    return [number for number in (normalize_number(line, country) for line in lines) if number]
 
 
 def normalize_tr_number(raw_number: str) -> str | None:
@@ -249,6 +287,136 @@ def normalize_tr_number(raw_number: str) -> str | None:
     return normalize_number(raw_number, "Turkey")
 
 
+def _get_driver(user_data_dir_path: str | None, initial_wait_seconds: int):
+    """Return the shared WhatsApp Web driver, starting Chrome on first use.
+
+    Args:
+        user_data_dir_path: Optional custom Chrome user data directory path.
+            Only used when a new browser has to be started.
+        initial_wait_seconds: Seconds to wait for WhatsApp Web to load initially.
+
+    Returns:
+        A logged-in Chrome WebDriver.
+
+    Raises:
+        RuntimeError: If webdriver-manager is not available.
+    """
+    global _DRIVER, _CHROMEDRIVER_PATH
+
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            try:
+                # Raises if the user closed the browser since the last send
+                _DRIVER.current_url
+                return _DRIVER
+            except Exception:  # noqa: BLE001
+                # Closing the window leaves chromedriver running; stop it before dropping it
+                try:
+                    _DRIVER.quit()
+                except Exception:  # noqa: BLE001
+                    pass
+                _DRIVER = None
+
+        # Prepare Chrome options to reuse a persistent (non-default) profile if provided
+        chrome_options = webdriver.ChromeOptions()
+        if user_data_dir_path:
+            try:
+                custom_dir = Path(user_data_dir_path)
+                custom_dir.mkdir(parents=True, exist_ok=True)
+                chrome_options.add_argument(f"--user-data-dir={str(custom_dir)}")
+            except Exception:
+                # Fall back silently to default behavior if parsing fails
+                pass
+        chrome_options.add_argument("--disable-notifications")
+
+        if not WEBDRIVER_MANAGER_AVAILABLE:
+            raise RuntimeError(
+                "webdriver-manager is not available. Install with: python -m pip install webdriver-manager"
+            )
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        driver = webdriver.Chrome(service=ChromeService(_CHROMEDRIVER_PATH), options=chrome_options)
+        driver.maximize_window()
+        driver.get("https://web.whatsapp.com/")
+
+        wait = WebDriverWait(driver, max(30, initial_wait_seconds))
+        try:
+            # Wait until chat sidebar/search becomes available (logged in)
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='textbox']")))
+        except Exception:
+            # Don't leave an unmanaged browser behind, e.g. when the QR code wasn't scanned in time
+            driver.quit()
+            raise
+
+        _DRIVER = driver
+        return driver
+
+
+@atexit.register
+def _quit_driver() -> None:
+    """Close the shared browser session, if any, when the program exits."""
+    global _DRIVER
+
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:  # noqa: BLE001
+            pass
+        _DRIVER = None
+
+
+# Returns [data-id, is_pending] for the last outgoing message row in the open
+# chat, or null when the chat has no outgoing messages
+_LAST_OUTGOING_JS = """
+const rows = document.querySelectorAll('div.message-out');
+if (!rows.length) return null;
+const row = rows[rows.length - 1];
+const holder = row.closest('[data-id]') || row.querySelector('[data-id]');
+return [holder ? holder.getAttribute('data-id') : null,
+        row.querySelector("span[data-icon='msg-time']") !== null];
+"""
+
+
+def _last_outgoing_id(driver) -> str | None:
+    """Return the data-id of the last outgoing message row in the open chat."""
+    last = driver.execute_script(_LAST_OUTGOING_JS)
+    return last[0] if last else None
+
+
+def _wait_until_sent(driver, last_id_before: str | None, timeout_seconds: int = 15) -> bool:
+    """Wait until a new outgoing message has left the pending (clock) state.
+
+    Args:
+        driver: The WhatsApp Web driver.
+        last_id_before: data-id of the last outgoing row before sending.
+        timeout_seconds: Maximum seconds to wait.
+
+    Returns:
+        True if the message was confirmed as sent, False on timeout.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    def sent(d) -> bool:
+        # Only the newest outgoing row counts; older pending messages elsewhere are ignored
+        last = d.execute_script(_LAST_OUTGOING_JS)
+        return bool(last) and last[0] is not None and last[0] != last_id_before and not last[1]
+
+    try:
+        WebDriverWait(driver, timeout_seconds, poll_frequency=0.2).until(sent)
+        return True
+    except TimeoutException:
+        return False
+
+
 def send_messages_single_tab(
     recipients: list[str],
     message: str,
@@ -267,61 +435,50 @@ def send_messages_single_tab(
         RuntimeError: If Selenium or webdriver-manager is not available.
 
     Note:
-        - Opens WhatsApp Web once and keeps the same tab.
+        - Opens WhatsApp Web once and keeps the same tab, reusing it across calls.
         - Requires the user to scan the QR on first run.
         - Navigates to each recipient's chat and sends the message.
     """
     if not SELENIUM_AVAILABLE:
         raise RuntimeError("Selenium is not available. Install with: python -m pip install selenium")
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
 
     if not recipients:
         print("No valid recipients found.")
         return
 
-    # Prepare Chrome options to reuse a persistent (non-default) profile if provided
-    chrome_options = webdriver.ChromeOptions()
-    if user_data_dir_path:
-        try:
-            custom_dir = Path(user_data_dir_path)
-            custom_dir.mkdir(parents=True, exist_ok=True)
-            chrome_options.add_argument(f"--user-data-dir={str(custom_dir)}")
-        except Exception:
-            # Fall back silently to default behavior if parsing fails
-            pass
-    chrome_options.add_argument("--disable-notifications")
-
-    if not WEBDRIVER_MANAGER_AVAILABLE:
-        raise RuntimeError(
-            "webdriver-manager is not available. Install with: python -m pip install webdriver-manager"
-        )
-    driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=chrome_options)
-    driver.maximize_window()
-    driver.get("https://web.whatsapp.com/")
-
-    wait = WebDriverWait(driver, max(30, initial_wait_seconds))
-    # Wait until chat sidebar/search becomes available (logged in)
-    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='textbox']")))
+    driver = _get_driver(user_data_dir_path, initial_wait_seconds)
+    # Poll often so each chat is used as soon as its message box appears
+    wait = WebDriverWait(driver, max(30, initial_wait_seconds), poll_frequency=0.2)
 
     print(f"Starting to send message to {len(recipients)} recipient(s) in single-tab mode...")
+    encoded_message = quote_plus(message)
     for index, phone_number in enumerate(recipients, start=1):
-        digits_only = phone_number.replace("+", "")
-        url = f"https://web.whatsapp.com/send?phone={digits_only}&text={quote_plus(message)}"
+        # Recipients are validated E.164, so the only '+' is the leading one
+        digits_only = phone_number[1:]
+        url = f"https://web.whatsapp.com/send?phone={digits_only}&text={encoded_message}"
         print(f"[{index}/{len(recipients)}] Sending to {phone_number} ...")
         try:
             driver.get(url)
             # Wait until the message box for this chat is ready
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[contenteditable='true'][data-tab='10']")))
+            message_box = wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[contenteditable='true'][data-tab='10']"))
+            )
             # Focus message box and send ENTER to send the prefilled text
-            message_box = driver.find_element(By.CSS_SELECTOR, "div[contenteditable='true'][data-tab='10']")
+            last_id_before = _last_outgoing_id(driver)
             message_box.send_keys(Keys.ENTER)
-            # Small settle delay between recipients
-            time.sleep(3)
+            # Leave the chat only once WhatsApp Web reports the message as sent
+            if not _wait_until_sent(driver, last_id_before):
+                print(f"Could not confirm delivery to {phone_number}; continuing.", file=sys.stderr)
         except Exception as error:  # noqa: BLE001
             print(f"Failed to send to {phone_number}: {error}", file=sys.stderr)
             time.sleep(2)
 
     print("Done.")
-    # Keep the tab open for user inspection; user can close manually
+    # The session stays open so the next send can reuse it; _quit_driver closes it on exit
 
 
 def launch_gui() -> None:
@@ -335,6 +492,9 @@ def launch_gui() -> None:
     - Single-tab mode toggle
     - Real-time logging
     """
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+
     root = tk.Tk()
     root.title("WPBot - WhatsApp Bulk Sender")
     root.geometry("720x540")
@@ -366,58 +526,64 @@ def launch_gui() -> None:
     
     country_var = tk.StringVar(value="Turkey")
     country_combo = ttk.Combobox(main_frame, textvariable=country_var, width=20, state="readonly")
-    country_combo['values'] = sorted(COUNTRY_CODES.keys())
+    country_combo['values'] = _COUNTRY_NAMES_SORTED
     country_combo.grid(row=1, column=1, sticky=tk.W, padx=4, pady=4)
     
     # Country description
-    country_desc_var = tk.StringVar(value=COUNTRY_CODES["Turkey"]["description"])
+    country_desc_var = tk.StringVar(value=_COUNTRY_DESC["Turkey"])
     country_desc_label = ttk.Label(main_frame, textvariable=country_desc_var, font=("TkDefaultFont", 8))
     country_desc_label.grid(row=1, column=2, sticky=tk.W, padx=4, pady=4)
     
     def update_country_desc(*args):
-        selected_country = country_var.get()
-        if selected_country in COUNTRY_CODES:
-            country_desc_var.set(COUNTRY_CODES[selected_country]["description"])
+        description = _COUNTRY_DESC.get(country_var.get())
+        if description is not None:
+            country_desc_var.set(description)
     
     country_var.trace('w', update_country_desc)
 
     # Recipients preview
     recipients_preview_label = ttk.Label(main_frame, text="Recipients Preview")
     recipients_preview_label.grid(row=2, column=0, sticky=tk.NW, padx=4, pady=(8, 4))
-    recipients_preview = tk.Text(main_frame, height=8, wrap=tk.NONE, state=tk.DISABLED)
-    recipients_preview.grid(row=2, column=1, columnspan=2, sticky=tk.NSEW, padx=4, pady=(8, 4))
+    preview_frame = ttk.Frame(main_frame)
+    preview_frame.grid(row=2, column=1, columnspan=2, sticky=tk.NSEW, padx=4, pady=(8, 4))
+    # Listbox keeps one row per number, so large lists stay responsive
+    recipients_preview = tk.Listbox(preview_frame, height=8, selectmode=tk.EXTENDED)
+    preview_scroll = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=recipients_preview.yview)
+    recipients_preview.configure(yscrollcommand=preview_scroll.set)
+    recipients_preview.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    preview_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+    # Numbers currently shown in the preview, kept on the Python side so the
+    # send worker does not have to read them back out of the widget
+    _preview_cache: list[str] = []
+
+    def _set_preview(rows: list[str]) -> None:
+        recipients_preview.delete(0, tk.END)
+        recipients_preview.insert(tk.END, *rows)
 
     def load_recipients_preview(file_path_str: str) -> None:
         try:
             # Load raw lines to allow normalization of local formats
-            raw_lines: list[str] = []
-            with Path(file_path_str).open('r', encoding='utf-8') as fh:
-                raw_lines = [ln.strip() for ln in fh.readlines() if ln.strip() and not ln.lstrip().startswith('#')]
+            text = Path(file_path_str).read_text(encoding='utf-8')
+            raw_lines = [ln for ln in (raw.strip() for raw in text.splitlines()) if ln and not ln.startswith('#')]
             # Show as-is first; normalization button may adjust
-            numbers = raw_lines
-            recipients_preview.configure(state=tk.NORMAL)
-            recipients_preview.delete("1.0", tk.END)
-            if numbers:
-                recipients_preview.insert(tk.END, "\n".join(numbers))
+            _preview_cache[:] = raw_lines
+            if _preview_cache:
+                _set_preview(_preview_cache)
             else:
-                recipients_preview.insert(tk.END, "(No valid recipients found)")
-            recipients_preview.configure(state=tk.DISABLED)
+                _set_preview(["(No valid recipients found)"])
         except Exception as error:  # noqa: BLE001
             messagebox.showerror("WPBot", f"Failed to read recipients: {error}")
 
     def normalize_preview_numbers() -> None:
         # Source: current preview content if non-empty, else try file path
-        recipients_preview.configure(state=tk.NORMAL)
-        current_text = recipients_preview.get("1.0", tk.END).strip()
-        recipients_preview.configure(state=tk.DISABLED)
-
         lines: list[str]
-        if current_text and not current_text.startswith("(No valid"):
-            lines = [ln.strip() for ln in current_text.splitlines() if ln.strip()]
+        if _preview_cache:
+            lines = list(_preview_cache)
         elif recipients_var.get().strip():
             try:
-                with Path(recipients_var.get().strip()).open('r', encoding='utf-8') as fh:
-                    lines = [ln.strip() for ln in fh.readlines() if ln.strip() and not ln.lstrip().startswith('#')]
+                text = Path(recipients_var.get().strip()).read_text(encoding='utf-8')
+                lines = [ln for ln in (raw.strip() for raw in text.splitlines()) if ln and not ln.startswith('#')]
             except Exception as error:  # noqa: BLE001
                 messagebox.showerror("WPBot", f"Failed to read recipients: {error}")
                 return
@@ -425,28 +591,14 @@ def launch_gui() -> None:
             messagebox.showinfo("WPBot", "Please select a recipients file or paste numbers into the preview.")
             return
 
-        normalized: list[str] = []
+        # Normalize and de-duplicate while preserving order
         selected_country = country_var.get()
-        for ln in lines:
-            result = normalize_number(ln, selected_country)
-            if result:
-                normalized.append(result)
-
-        # De-duplicate while preserving order
-        seen: set[str] = set()
-        unique_normalized = []
-        for num in normalized:
-            if num not in seen:
-                seen.add(num)
-                unique_normalized.append(num)
-
-        recipients_preview.configure(state=tk.NORMAL)
-        recipients_preview.delete("1.0", tk.END)
-        if unique_normalized:
-            recipients_preview.insert(tk.END, "\n".join(unique_normalized))
+        _preview_cache[:] = dict.fromkeys(normalize_many(lines, selected_country))
+
+        if _preview_cache:
+            _set_preview(_preview_cache)
         else:
-            recipients_preview.insert(tk.END, "(No numbers matched normalization rules)")
-        recipients_preview.configure(state=tk.DISABLED)
+            _set_preview(["(No numbers matched normalization rules)"])
 
     # After defining preview loader, update browse to fill it
     def browse_recipients() -> None:
@@ -516,16 +668,8 @@ def launch_gui() -> None:
         def worker() -> None:
             try:
                 # Prefer numbers from preview if present, else read from file
-                recipients_preview.configure(state=tk.NORMAL)
-                preview_text = recipients_preview.get("1.0", tk.END).strip()
-                recipients_preview.configure(state=tk.DISABLED)
-
-                if preview_text and not preview_text.startswith("("):
-                    recipients_list: list[str] = []
-                    for ln in preview_text.splitlines():
-                        val = ln.strip()
-                        if val and val.startswith('+') and val.replace('+', '').isdigit():
-                            recipients_list.append(val)
+                if _preview_cache:
+                    recipients_list = [number for number in _preview_cache if _E164_RE.match(number)]
                 else:
                     if not recipients_path_str:
                         raise ValueError("Please select a recipients .txt file or normalize/paste numbers in the preview.")